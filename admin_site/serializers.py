@@ -57,13 +57,14 @@ class AdminUserDetailSerializer(serializers.ModelSerializer):
         return "0:00:00"
     
     def get_teams(self, obj):
-        teams = Team.objects.filter(members__user=obj).distinct()
+        # One query via the membership rows instead of a lookup per team
+        memberships = TeamMember.objects.filter(user=obj).select_related('team').order_by('-team__created_at')
         return [{
-            'id': t.id, 
-            'name': t.name, 
+            'id': m.team.id, 
+            'name': m.team.name, 
             'role': 'member',
-            'joined_at': TeamMember.objects.get(team=t, user=obj).joined_at
-        } for t in teams]
+            'joined_at': m.joined_at
+        } for m in memberships]
     
     def get_owned_teams(self, obj):
         teams = Team.objects.filter(owner=obj)
@@ -8,7 +8,7 @@ from rest_framework import status
 from rest_framework.test import APITestCase
 
 from admin_site.models import ActivityLog
-from management.models import Project, Screenshot, TimeEntry
+from management.models import Project, Screenshot, Team, TeamMember, TimeEntry
 
 
 @override_settings(SECURE_SSL_REDIRECT=False)
@@ -128,3 +128,35 @@ class AdminScreenshotListTests(APITestCase):
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(len(response.data["results"]), 1)
         self.assertEqual(response.data["results"][0]["project_name"], "Client Delivery")
+
+
+@override_settings(SECURE_SSL_REDIRECT=False)
+class AdminUserDetailTests(APITestCase):
+    def setUp(self):
+        user_model = get_user_model()
+        self.admin = user_model.objects.create_superuser(
+            email="admin3@example.com",
+            password="secret123",
+            username="admin3",
+        )
+        self.employee = user_model.objects.create_user(
+            email="employee3@example.com",
+            password="secret123",
+            username="employee3",
+        )
+        self.client.force_authenticate(self.admin)
+
+    def test_retrieve_lists_joined_teams(self):
+        first = Team.objects.create(name="First", description="", owner=self.admin)
+        second = Team.objects.create(name="Second", description="", owner=self.admin)
+        TeamMember.objects.create(team=first, user=self.employee)
+        membership = TeamMember.objects.create(team=second, user=self.employee)
+
+        response = self.client.get(reverse("admin-user-detail", args=[self.employee.id]))
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        teams = response.data["teams"]
+        self.assertEqual([team["name"] for team in teams], ["Second", "First"])
+        self.assertEqual(teams[0]["id"], second.id)
+        self.assertEqual(teams[0]["role"], "member")
+        self.assertEqual(teams[0]["joined_at"], membership.joined_at)
@@ -1,6 +1,7 @@
 ﻿from django.db import models
 from django.conf import settings
 from django.utils import timezone
+import secrets
 import uuid
 
 
@@ -194,3 +195,21 @@ class TeamInvitation(models.Model):
     
     def is_valid(self):
         return self.status == 'pending' and self.expires_at > timezone.now()
+
+    @classmethod
+    def make_placeholder(cls):
+        """Return a unique placeholder email for link-only invitations"""
+        return f"invite-{secrets.token_hex(6)}@pending.local"
+
+    @classmethod
+    def create_pending(cls, team, invited_by, expires_at, count=1):
+        """Create `count` link-only invitations for a team in a single INSERT"""
+        return cls.objects.bulk_create([
+            cls(
+                team=team,
+                email=cls.make_placeholder(),
+                invited_by=invited_by,
+                expires_at=expires_at,
+            )
+            for _ in range(count)
+        ])
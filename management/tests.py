@@ -7,7 +7,7 @@ from django.utils import timezone
 from rest_framework import status
 from rest_framework.test import APITestCase
 
-from management.models import Project, Team, TimeEntry
+from management.models import Project, Team, TeamInvitation, TeamMember, TimeEntry
 
 
 @override_settings(SECURE_SSL_REDIRECT=False)
@@ -143,3 +143,103 @@ class TeamAssignProjectTests(APITestCase):
         self.assertEqual(response.data["detail"], "Project is already assigned to this team")
         self.assertEqual(response.data["project"]["id"], project.id)
         self.assertEqual(response.data["project"]["team_id"], self.team.id)
+
+
+@override_settings(SECURE_SSL_REDIRECT=False)
+class AcceptInvitationTests(APITestCase):
+    def setUp(self):
+        user_model = get_user_model()
+        self.owner = user_model.objects.create_user(
+            email="invite-owner@example.com",
+            username="invite-owner",
+            password="secret123",
+        )
+        self.user = user_model.objects.create_user(
+            email="invitee@example.com",
+            username="invitee",
+            password="secret123",
+        )
+        self.client.force_authenticate(self.user)
+        self.team = Team.objects.create(name="Beta Team", description="", owner=self.owner)
+        self.invitation = TeamInvitation.objects.create(
+            team=self.team,
+            email=self.user.email,
+            invited_by=self.owner,
+            expires_at=timezone.now() + timedelta(days=7),
+        )
+
+    def test_accept_invitation_adds_member(self):
+        response = self.client.post(reverse("accept-invitation", args=[self.invitation.token]))
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertTrue(TeamMember.objects.filter(team=self.team, user=self.user).exists())
+        self.invitation.refresh_from_db()
+        self.assertEqual(self.invitation.status, "accepted")
+        self.assertIsNotNone(self.invitation.accepted_at)
+
+    def test_accept_invitation_rejects_existing_member(self):
+        TeamMember.objects.create(team=self.team, user=self.user)
+
+        response = self.client.post(reverse("accept-invitation", args=[self.invitation.token]))
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(response.data["detail"], "You are already a member of this team")
+        self.invitation.refresh_from_db()
+        self.assertEqual(self.invitation.status, "pending")
+
+
+class TeamInvitationCreatePendingTests(APITestCase):
+    def test_create_pending_creates_unique_placeholder_invitations(self):
+        owner = get_user_model().objects.create_user(
+            email="bulk-owner@example.com",
+            username="bulk-owner",
+            password="secret123",
+        )
+        team = Team.objects.create(name="Gamma Team", description="", owner=owner)
+
+        invitations = TeamInvitation.create_pending(
+            team,
+            owner,
+            expires_at=timezone.now() + timedelta(days=7),
+            count=3,
+        )
+
+        self.assertEqual(TeamInvitation.objects.filter(team=team).count(), 3)
+        emails = {invitation.email for invitation in invitations}
+        self.assertEqual(len(emails), 3)
+        for email in emails:
+            self.assertTrue(email.endswith("@pending.local"))
+
+
+@override_settings(SECURE_SSL_REDIRECT=False)
+class TimeEntryStopTests(APITestCase):
+    def setUp(self):
+        self.user = get_user_model().objects.create_user(
+            email="timer@example.com",
+            username="timer-user",
+            password="secret123",
+        )
+        self.client.force_authenticate(self.user)
+
+    def test_stop_sets_end_time_and_duration(self):
+        entry = TimeEntry.objects.create(
+            user=self.user,
+            description="running",
+            start_time=timezone.now() - timedelta(minutes=5),
+            is_running=True,
+        )
+
+        response = self.client.post(reverse("timeentry-stop"))
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["id"], entry.id)
+        self.assertFalse(response.data["is_running"])
+        entry.refresh_from_db()
+        self.assertFalse(entry.is_running)
+        self.assertEqual(entry.duration, entry.end_time - entry.start_time)
+
+    def test_stop_without_running_timer(self):
+        response = self.client.post(reverse("timeentry-stop"))
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(response.data["detail"], "No active timer to stop")
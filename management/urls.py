@@ -11,7 +11,6 @@ router.register(r'screenshots', views.ScreenshotViewSet, basename='screenshot')
 urlpatterns = [
     path('', include(router.urls)),
     path('reports/', views.ReportView.as_view(), name='reports'),
-    path('user/', views.CurrentUserView.as_view(), name='current-user'),
     path('teams/<int:team_id>/invite/', views.send_team_invitation, name='send-invitation'),
     path('teams/invitations/<uuid:token>/', views.get_invitation_details, name='invitation-details'),
     path('teams/invitations/<uuid:token>/accept/', views.accept_invitation, name='accept-invitation'),
@@ -1,22 +1,22 @@
 # management/views.py
 import logging
 from datetime import timedelta
-from uuid import uuid4
 
 from django.contrib.auth import get_user_model
-from django.db.models import Sum
+from django.db.models import DateTimeField, DurationField, ExpressionWrapper, F, Sum, Value
 from django.db.models.functions import TruncMonth, TruncWeek
 from django.http import Http404
 from django.utils import timezone
 from rest_framework import status, viewsets
 from rest_framework.decorators import action, api_view, permission_classes
 from rest_framework.exceptions import PermissionDenied
-from rest_framework.parsers import FormParser, MultiPartParser
+from rest_framework.parsers import FormParser
 from rest_framework.permissions import AllowAny, IsAuthenticated
 from rest_framework.response import Response
 from rest_framework.views import APIView
 from decouple import config
 from admin_site.admin_config import get_admin_setting, send_admin_email
+from tickr.parsers import LargeChunkMultiPartParser
 
 from .models import Project, Team, TeamMember, TimeEntry, TeamInvitation, Screenshot
 from .serializers import (
@@ -30,14 +30,17 @@ from .serializers import (
 User = get_user_model()
 
 logger = logging.getLogger(__name__)
+# Shared, immutable permission set for every authenticated endpoint below
+_AUTH_PERMS = (IsAuthenticated,)
 FRONTEND_URL = config('FRONTEND_URL', default='https://tickr-frontend.vercel.app/')
+INVITE_BASE = FRONTEND_URL.rstrip('/') + '/teams/AcceptInvite/'
 
 
 # PROJECT VIEWSET
 class ProjectViewSet(viewsets.ModelViewSet):
     queryset = Project.objects.all()
     serializer_class = ProjectSerializer
-    permission_classes = [IsAuthenticated]
+    permission_classes = _AUTH_PERMS
 
     def get_queryset(self):
         """Return projects created by the user OR projects assigned to teams where user is a member/owner"""
@@ -70,7 +73,7 @@ class ProjectViewSet(viewsets.ModelViewSet):
 class TeamViewSet(viewsets.ModelViewSet):
     queryset = Team.objects.all()
     serializer_class = TeamSerializer
-    permission_classes = [IsAuthenticated]
+    permission_classes = _AUTH_PERMS
 
     def get_queryset(self):
         """Return teams owned by the current user or teams they are a member of"""
@@ -139,15 +142,13 @@ class TeamViewSet(viewsets.ModelViewSet):
                     status=status.HTTP_400_BAD_REQUEST
                 )
 
-            unique_placeholder = f"invite-{uuid4().hex[:12]}@pending.local"
-            invitation = TeamInvitation.objects.create(
-                team=team,
-                email=unique_placeholder,
-                invited_by=request.user,
+            invitation = TeamInvitation.create_pending(
+                team,
+                request.user,
                 expires_at=timezone.now() + timedelta(days=get_admin_setting('team_invite_expiry_days'))
-            )
+            )[0]
             
-            invitation_link = f"{FRONTEND_URL}/teams/AcceptInvite/{invitation.token}"
+            invitation_link = INVITE_BASE + str(invitation.token)
             
             return Response({
                 "invite_link": invitation_link,
@@ -168,6 +169,8 @@ class TeamViewSet(viewsets.ModelViewSet):
         """List all members of a team (including owner)"""
         team = Team.objects.select_related('owner').prefetch_related('members__user').get(pk=pk)
         members = team.members.all()
+        owner = team.owner
+        owner_id = team.owner_id
         
         # Build member list with role information
         member_data = []
@@ -175,13 +178,13 @@ class TeamViewSet(viewsets.ModelViewSet):
         # Always include the owner first
         owner_in_members = False
         for member in members:
-            if member.user == team.owner:
+            if member.user_id == owner_id:
                 owner_in_members = True
                 member_data.append({
                     'id': member.id,
-                    'user_id': team.owner.id,
-                    'username': team.owner.username,
-                    'email': team.owner.email,
+                    'user_id': owner_id,
+                    'username': owner.username,
+                    'email': owner.email,
                     'role': 'owner',
                     'joined_at': team.created_at  # Use team creation date for owner
                 })
@@ -199,9 +202,9 @@ class TeamViewSet(viewsets.ModelViewSet):
         if not owner_in_members:
             member_data.insert(0, {
                 'id': -1,  # Special ID for owner not in TeamMember table
-                'user_id': team.owner.id,
-                'username': team.owner.username,
-                'email': team.owner.email,
+                'user_id': owner_id,
+                'username': owner.username,
+                'email': owner.email,
                 'role': 'owner',
                 'joined_at': team.created_at
             })
@@ -301,12 +304,16 @@ class TeamViewSet(viewsets.ModelViewSet):
                 )
 
             try:
-                project = Project.objects.select_related('creator', 'team').get(
+                project = Project.objects.select_related('creator').get(
                     id=project_id,
                     creator=request.user
                 )
 
-                if project.team_id == team.id:
+                already_assigned = project.team_id == team.id
+                # Reuse the team loaded above instead of joining it again
+                project.team = team
+
+                if already_assigned:
                     return Response(
                         {
                             "detail": "Project is already assigned to this team",
@@ -315,7 +322,6 @@ class TeamViewSet(viewsets.ModelViewSet):
                         status=status.HTTP_200_OK
                     )
 
-                project.team = team
                 project.save(update_fields=['team'])
 
                 return Response({
@@ -369,7 +375,7 @@ class TeamViewSet(viewsets.ModelViewSet):
         
         try:
             # Get the project
-            project = Project.objects.select_related('creator', 'team').get(
+            project = Project.objects.select_related('creator').get(
                 id=project_id,
                 team=team,
                 creator=request.user
@@ -404,7 +410,7 @@ class TeamViewSet(viewsets.ModelViewSet):
 class TimeEntryViewSet(viewsets.ModelViewSet):
     queryset = TimeEntry.objects.all()
     serializer_class = TimeEntrySerializer
-    permission_classes = [IsAuthenticated]
+    permission_classes = _AUTH_PERMS
 
     def get_queryset(self):
         """Return only current user's entries"""
@@ -477,20 +483,30 @@ class TimeEntryViewSet(viewsets.ModelViewSet):
     @action(detail=False, methods=['post'])
     def stop(self, request):
         """Stop the currently running timer"""
-        entry = TimeEntry.objects.select_related('project').filter(
+        now = timezone.now()
+        # Single UPDATE; duration is computed in SQL since save() is bypassed
+        stopped = TimeEntry.objects.filter(
             user=request.user,
             is_running=True
-        ).first()
+        ).update(
+            end_time=now,
+            is_running=False,
+            duration=ExpressionWrapper(
+                Value(now, output_field=DateTimeField()) - F('start_time'),
+                output_field=DurationField()
+            )
+        )
 
-        if not entry:
+        if not stopped:
             return Response(
                 {"detail": "No active timer to stop"},
                 status=status.HTTP_400_BAD_REQUEST
             )
 
-        entry.end_time = timezone.now()
-        entry.is_running = False
-        entry.save()
+        entry = TimeEntry.objects.select_related('project').filter(
+            user=request.user,
+            end_time=now
+        ).first()
 
         return Response(TimeEntrySerializer(entry, context={'request': request}).data)
 
@@ -498,8 +514,8 @@ class TimeEntryViewSet(viewsets.ModelViewSet):
 class ScreenshotViewSet(viewsets.ModelViewSet):
     queryset = Screenshot.objects.all()
     serializer_class = ScreenshotSerializer
-    permission_classes = [IsAuthenticated]
-    parser_classes = [MultiPartParser, FormParser]
+    permission_classes = _AUTH_PERMS
+    parser_classes = [LargeChunkMultiPartParser, FormParser]
     http_method_names = ["get", "post", "head", "options", "delete"]
 
     def get_queryset(self):
@@ -527,7 +543,7 @@ class ScreenshotViewSet(viewsets.ModelViewSet):
         )
 
 class ReportView(APIView):
-    permission_classes = [IsAuthenticated]
+    permission_classes = _AUTH_PERMS
 
     @staticmethod
     def _duration_to_hms(duration):
@@ -618,35 +634,10 @@ class ReportView(APIView):
         })
 
 
-# USER INFO ENDPOINT
-class CurrentUserView(APIView):
-    permission_classes = [IsAuthenticated]
-
-    def get(self, request):
-        """Return the authenticated user's info including admin flags"""
-        try:
-            from user.serializers import UserSerializer
-            serializer = UserSerializer(request.user, context={'request': request})
-            return Response(serializer.data, status=status.HTTP_200_OK)
-        except Exception:
-            # Fallback if serializer import fails
-            is_admin = bool(getattr(request.user, 'is_staff', False) or getattr(request.user, 'is_superuser', False))
-            role = 'admin' if is_admin else 'employee'
-            return Response({
-                "id": request.user.id,
-                "email": request.user.email,
-                "username": request.user.username,
-                "is_staff": getattr(request.user, 'is_staff', False),
-                "is_superuser": getattr(request.user, 'is_superuser', False),
-                "is_admin": is_admin,
-                "role": role,
-            }, status=status.HTTP_200_OK)
-
-
 # INVITATION ENDPOINTS
 
 @api_view(['POST'])
-@permission_classes([IsAuthenticated])
+@permission_classes(_AUTH_PERMS)
 def send_team_invitation(request, team_id):
     """Send invitation to join a team"""
     try:
@@ -691,7 +682,7 @@ def send_team_invitation(request, team_id):
             expires_at=timezone.now() + timedelta(days=get_admin_setting('team_invite_expiry_days'))
         )
         
-        invitation_link = f"{FRONTEND_URL}/teams/AcceptInvite/{invitation.token}"
+        invitation_link = INVITE_BASE + str(invitation.token)
 
         if get_admin_setting("invite_emails_enabled"):
             try:
@@ -714,15 +705,13 @@ def send_team_invitation(request, team_id):
         }, status=status.HTTP_201_CREATED)
     
     if not email:
-        unique_placeholder = f"invite-{uuid4().hex[:12]}@pending.local"
-        invitation = TeamInvitation.objects.create(
-            team=team,
-            email=unique_placeholder,
-            invited_by=request.user,
+        invitation = TeamInvitation.create_pending(
+            team,
+            request.user,
             expires_at=timezone.now() + timedelta(days=get_admin_setting('team_invite_expiry_days'))
-        )
+        )[0]
         
-        invitation_link = f"{FRONTEND_URL}/teams/AcceptInvite/{invitation.token}"
+        invitation_link = INVITE_BASE + str(invitation.token)
         
         return Response({
             "detail": "Invitation link created successfully",
@@ -760,7 +749,7 @@ def send_team_invitation(request, team_id):
         expires_at=timezone.now() + timedelta(days=get_admin_setting('team_invite_expiry_days'))
     )
     
-    invitation_link = f"{FRONTEND_URL}/teams/AcceptInvite/{invitation.token}"
+    invitation_link = INVITE_BASE + str(invitation.token)
 
     if get_admin_setting("invite_emails_enabled"):
         try:
@@ -805,11 +794,11 @@ def get_invitation_details(request, token):
 
 
 @api_view(['POST'])
-@permission_classes([IsAuthenticated])
+@permission_classes(_AUTH_PERMS)
 def accept_invitation(request, token):
     """Accept a team invitation"""
     try:
-        invitation = TeamInvitation.objects.get(token=token)
+        invitation = TeamInvitation.objects.select_related('team__owner', 'invited_by').get(token=token)
     except TeamInvitation.DoesNotExist:
         return Response(
             {"detail": "Invitation not found"},
@@ -822,20 +811,19 @@ def accept_invitation(request, token):
             status=status.HTTP_400_BAD_REQUEST
         )
     
-    if TeamMember.objects.filter(team=invitation.team, user=request.user).exists():
-        return Response(
-            {"detail": "You are already a member of this team"},
-            status=status.HTTP_400_BAD_REQUEST
-        )
-    
     member, created = TeamMember.objects.get_or_create(
         team=invitation.team,
         user=request.user
     )
-    
+    if not created:
+        return Response(
+            {"detail": "You are already a member of this team"},
+            status=status.HTTP_400_BAD_REQUEST
+        )
+
     invitation.status = 'accepted'
     invitation.accepted_at = timezone.now()
-    invitation.save()
+    invitation.save(update_fields=['status', 'accepted_at'])
     
     return Response({
         "detail": "Successfully joined the team!",
@@ -844,7 +832,7 @@ def accept_invitation(request, token):
 
 
 @api_view(['POST'])
-@permission_classes([IsAuthenticated])
+@permission_classes(_AUTH_PERMS)
 def decline_invitation(request, token):
     """Decline a team invitation"""
     try:
@@ -856,13 +844,13 @@ def decline_invitation(request, token):
         )
     
     invitation.status = 'declined'
-    invitation.save()
+    invitation.save(update_fields=['status'])
     
     return Response({"detail": "Invitation declined"})
 
 
 @api_view(['GET'])
-@permission_classes([IsAuthenticated])
+@permission_classes(_AUTH_PERMS)
 def my_invitations(request):
     """Get all pending invitations for the logged-in user"""
     invitations = TeamInvitation.objects.select_related('team__owner', 'invited_by').filter(
@@ -0,0 +1,16 @@
+import json
+
+import orjson
+
+
+class ORJSONEncoder(json.JSONEncoder):
+    """JSONEncoder that hands the whole document to orjson.
+
+    PyJWT serializes token headers and payloads via ``json.dumps(cls=...)``,
+    so overriding ``encode`` lets SimpleJWT use orjson without any other
+    changes. orjson output is already compact, matching PyJWT's separators.
+    """
+
+    def encode(self, o):
+        option = orjson.OPT_SORT_KEYS if self.sort_keys else 0
+        return orjson.dumps(o, option=option).decode()
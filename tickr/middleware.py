@@ -1,10 +1,26 @@
 from django.conf import settings
+from django.test.signals import setting_changed
+from django.utils.cache import patch_vary_headers
 from django.utils.deprecation import MiddlewareMixin
 import logging
-from urllib.parse import urlparse
+import re
 
 logger = logging.getLogger(__name__)
 
+# scheme://host[:port] with nothing after the authority
+_ORIGIN_RE = re.compile(r"https?://[^/\s?#]+")
+
+_CORS_SETTINGS = frozenset({
+    "CORS_ALLOWED_ORIGINS",
+    "CORS_ALLOW_ALL_ORIGINS",
+    "CORS_ALLOW_CREDENTIALS",
+    "CORS_ALLOW_METHODS_HEADER",
+    "CORS_ALLOW_HEADERS_HEADER",
+    "CORS_PREFLIGHT_MAX_AGE",
+})
+
+_PREFLIGHT_VARY = ("Origin", "Access-Control-Request-Method", "Access-Control-Request-Headers")
+
 
 def _normalize_allowed(origins):
     """Return a cleaned list of allowed origins.
@@ -26,11 +42,7 @@ def _normalize_allowed(origins):
 
 def _is_valid_origin(origin):
     """Basic validation for an origin string (scheme + netloc)."""
-    try:
-        parsed = urlparse(origin)
-        return parsed.scheme in ("http", "https") and bool(parsed.netloc)
-    except Exception:
-        return False
+    return _ORIGIN_RE.fullmatch(origin) is not None
 
 
 class EnsureCORSHeadersMiddleware(MiddlewareMixin):
@@ -43,61 +55,82 @@ class EnsureCORSHeadersMiddleware(MiddlewareMixin):
     values (for example a Python list repr).
     """
 
+    def __init__(self, get_response):
+        super().__init__(get_response)
+        self._load_settings()
+        # Keep the cached values in sync when tests override settings
+        setting_changed.connect(self._on_setting_changed)
+
+    def _load_settings(self):
+        # Settings don't change per request, so resolve them once up front
+        # Invalid entries are dropped here so requests only need a set lookup
+        self._allowed = frozenset(
+            o for o in _normalize_allowed(getattr(settings, "CORS_ALLOWED_ORIGINS", []) or []) if _is_valid_origin(o)
+        )
+        self._allow_all = bool(getattr(settings, "CORS_ALLOW_ALL_ORIGINS", False))
+        self._allow_creds = bool(getattr(settings, "CORS_ALLOW_CREDENTIALS", False))
+        self._methods_header = getattr(
+            settings, "CORS_ALLOW_METHODS_HEADER", "GET, POST, OPTIONS, PUT, PATCH, DELETE"
+        )
+        self._headers_header = getattr(
+            settings, "CORS_ALLOW_HEADERS_HEADER", "authorization, content-type, origin, x-requested-with"
+        )
+        self._max_age = str(getattr(settings, "CORS_PREFLIGHT_MAX_AGE", 86400))
+        # Logging config is fixed for the life of the process
+        self._debug = logger.isEnabledFor(logging.DEBUG)
+
+    def _on_setting_changed(self, setting, **kwargs):
+        if setting in _CORS_SETTINGS:
+            self._load_settings()
+
     def process_response(self, request, response):
         origin = request.META.get("HTTP_ORIGIN")
-
-        # If no Origin header, nothing to do.
+        # Non-CORS requests are the common case; skip all other work for them
         if not origin:
-            logger.debug("No Origin header on request %s %s", request.method, request.path)
             return response
 
+        is_preflight = request.method == "OPTIONS"
+
+        headers = response.headers
+
         # If header already present, log and return
-        if response.has_header("Access-Control-Allow-Origin"):
-            logger.debug(
-                "Response for %s %s already has CORS header: %s",
-                request.method,
-                request.path,
-                response.get("Access-Control-Allow-Origin"),
-            )
+        if "Access-Control-Allow-Origin" in headers:
+            if self._debug:
+                logger.debug(
+                    "Response for %s %s already has CORS header: %s",
+                    request.method,
+                    request.path,
+                    headers["Access-Control-Allow-Origin"],
+                )
             return response
 
-        # Determine allowed origins (normalize to list)
-        try:
-            allowed = getattr(settings, "CORS_ALLOWED_ORIGINS", []) or []
-            allowed = _normalize_allowed(allowed)
-        except Exception:
-            allowed = []
-
         # If all origins allowed, set wildcard
-        if getattr(settings, "CORS_ALLOW_ALL_ORIGINS", False):
-            response["Access-Control-Allow-Origin"] = "*"
-            logger.debug("Set Access-Control-Allow-Origin='*' for %s", request.path)
+        aco = None
+        if self._allow_all:
+            aco = response["Access-Control-Allow-Origin"] = "*"
+            if self._debug:
+                logger.debug("Set Access-Control-Allow-Origin='*' for %s", request.path)
         else:
+            # The outcome depends on Origin, so shared caches must key on it
+            patch_vary_headers(response, _PREFLIGHT_VARY if is_preflight else ("Origin",))
             # Only reflect the origin if it's explicitly allowed and looks valid
-            if origin in allowed and _is_valid_origin(origin):
-                response["Access-Control-Allow-Origin"] = origin
-                logger.debug("Reflected Origin %s for %s", origin, request.path)
-            else:
-                logger.debug(
-                    "Origin %s not in allowed list for %s. Allowed: %s",
-                    origin,
-                    request.path,
-                    allowed,
-                )
+            if origin in self._allowed:
+                aco = response["Access-Control-Allow-Origin"] = origin
+                if self._debug:
+                    logger.debug("Reflected Origin %s for %s", origin, request.path)
 
         # If credentials are allowed, reflect that (only for non-* origins)
-        if getattr(settings, "CORS_ALLOW_CREDENTIALS", False):
-            aco = response.get("Access-Control-Allow-Origin")
-            if aco and aco != "*":
-                response["Access-Control-Allow-Credentials"] = "true"
+        if self._allow_creds and aco and aco != "*":
+            response["Access-Control-Allow-Credentials"] = "true"
 
         # For preflight requests, echo allowed methods and headers if missing
-        if request.method == "OPTIONS":
-            if not response.has_header("Access-Control-Allow-Methods"):
-                methods = getattr(settings, "CORS_ALLOW_METHODS", ["GET", "POST", "OPTIONS", "PUT", "PATCH", "DELETE"])
-                response["Access-Control-Allow-Methods"] = ", ".join(methods)
-            if not response.has_header("Access-Control-Allow-Headers"):
-                headers = getattr(settings, "CORS_ALLOW_HEADERS", ["authorization", "content-type", "origin", "x-requested-with"])
-                response["Access-Control-Allow-Headers"] = ", ".join(headers)
+        if is_preflight:
+            if "Access-Control-Allow-Methods" not in headers:
+                response["Access-Control-Allow-Methods"] = self._methods_header
+            if "Access-Control-Allow-Headers" not in headers:
+                response["Access-Control-Allow-Headers"] = self._headers_header
+            # Let browsers cache the preflight, but only for allowed origins
+            if aco and "Access-Control-Max-Age" not in headers:
+                response["Access-Control-Max-Age"] = self._max_age
 
         return response
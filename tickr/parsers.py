@@ -0,0 +1,21 @@
+from rest_framework.parsers import MultiPartParser
+
+
+class LargeChunkMultiPartParser(MultiPartParser):
+    """MultiPartParser that reads the request body in larger chunks.
+
+    Django's multipart parser consumes the stream in steps of the smallest
+    upload handler ``chunk_size`` (64 KiB by default), so a multi-megabyte
+    image upload turns into dozens of read/boundary-scan iterations. Raising
+    the handlers' chunk size for this request cuts that down.
+    """
+
+    chunk_size = 1024 * 1024
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        request = (parser_context or {}).get('request')
+        if request is not None:
+            for handler in request.upload_handlers:
+                if handler.chunk_size and handler.chunk_size < self.chunk_size:
+                    handler.chunk_size = self.chunk_size
+        return super().parse(stream, media_type, parser_context)
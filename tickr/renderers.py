@@ -0,0 +1,33 @@
+import orjson
+from rest_framework.renderers import JSONRenderer
+
+# orjson formats datetimes differently from DRF (full microseconds, no "Z"),
+# so route them through DRF's encoder to keep responses byte-identical.
+_ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+
+
+class ORJSONRenderer(JSONRenderer):
+    """JSONRenderer that encodes compact responses with orjson.
+
+    Types orjson doesn't handle (or formats differently) fall back to DRF's
+    ``JSONEncoder.default``. Pretty-printed or non-default JSON settings use
+    the stock renderer.
+    """
+
+    def __init__(self):
+        self._default = self.encoder_class().default
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b''
+
+        if (
+            not self.compact
+            or self.ensure_ascii
+            or self.get_indent(accepted_media_type, renderer_context or {}) is not None
+        ):
+            return super().render(data, accepted_media_type, renderer_context)
+
+        ret = orjson.dumps(data, default=self._default, option=_ORJSON_OPTIONS)
+        # Match JSONRenderer: escape U+2028/U+2029 so output is a JS subset
+        return ret.replace(b'\xe2\x80\xa8', b'\\u2028').replace(b'\xe2\x80\xa9', b'\\u2029')
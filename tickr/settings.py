@@ -4,6 +4,7 @@ Django settings for tickr project
 from pathlib import Path
 from decouple import config, Csv
 from datetime import timedelta
+from functools import lru_cache
 from urllib.parse import unquote, urlparse
 
 # Build paths
@@ -12,6 +13,7 @@ BASE_DIR = Path(__file__).resolve().parent.parent
 # SECURITY
 SECRET_KEY = config('SECRET_KEY')
 DEBUG = config('DEBUG', default=False, cast=bool)
+IS_VERCEL = config('VERCEL', default=False, cast=bool)
 ALLOWED_HOSTS = config(
     'ALLOWED_HOSTS',
     default='localhost,127.0.0.1,.vercel.app',
@@ -51,9 +53,12 @@ MIDDLEWARE = [
     'django.contrib.auth.middleware.AuthenticationMiddleware',
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
-    # 'tickr.middleware.EnsureCORSHeadersMiddleware',  # ← COMMENTED OUT – it was breaking things
 ]
 
+# corsheaders handles CORS; the fallback middleware is only loaded when opted in
+if config('ENABLE_FALLBACK_CORS', default=False, cast=bool):
+    MIDDLEWARE.append('tickr.middleware.EnsureCORSHeadersMiddleware')
+
 ROOT_URLCONF = 'tickr.urls'
 WSGI_APPLICATION = 'tickr.wsgi.application'
 
@@ -96,39 +101,48 @@ else:
             'OPTIONS': {
                 'sslmode': 'require',
             },
+            # Reuse connections across requests to skip the TCP/TLS/auth handshake.
+            # Serverless instances are short-lived, so leave pooling to the DB pooler there.
+            'CONN_MAX_AGE': config('DB_CONN_MAX_AGE', default=0 if IS_VERCEL else 60, cast=int),
+            'CONN_HEALTH_CHECKS': True,
         }
     }
 
 # CORS
 CORS_ALLOW_ALL_ORIGINS = config('CORS_ALLOW_ALL_ORIGINS', default=False, cast=bool)
 CORS_ALLOW_CREDENTIALS = True
+# How long browsers may cache preflight responses (seconds)
+CORS_PREFLIGHT_MAX_AGE = config('CORS_PREFLIGHT_MAX_AGE', default=86400, cast=int)
+# Pre-joined preflight header values for the fallback CORS middleware
+CORS_ALLOW_METHODS_HEADER = ", ".join(
+    config('CORS_ALLOW_METHODS', default='GET,POST,OPTIONS,PUT,PATCH,DELETE', cast=Csv())
+)
+CORS_ALLOW_HEADERS_HEADER = ", ".join(
+    config('CORS_ALLOW_HEADERS', default='authorization,content-type,origin,x-requested-with', cast=Csv())
+)
 
 # Optional strict lists (ignored when CORS_ALLOW_ALL_ORIGINS=True)
 # Normalize origins: django-cors-headers requires scheme://host[:port] with no path or trailing slash
+@lru_cache(maxsize=None)
+def _normalize_origin(origin):
+    # Trim whitespace
+    origin = origin.strip()
+    # Parse the origin and rebuild scheme://netloc
+    parsed = urlparse(origin)
+    if parsed.scheme and parsed.netloc:
+        return f"{parsed.scheme}://{parsed.netloc}"
+    # If no scheme provided, try assuming https
+    if '://' not in origin:
+        attempt = urlparse('https://' + origin.rstrip('/'))
+        if attempt.scheme and attempt.netloc:
+            return f"{attempt.scheme}://{attempt.netloc}"
+    # As a last resort, strip any trailing slash
+    return origin.rstrip('/')
+
+
 def _normalize_origins(raw_origins):
-    if not raw_origins:
-        return []
-    normalized = []
-    for origin in raw_origins:
-        if not origin:
-            continue
-        # Trim whitespace
-        origin = origin.strip()
-        # Parse the origin and rebuild scheme://netloc
-        parsed = urlparse(origin)
-        if parsed.scheme and parsed.netloc:
-            normalized.append(f"{parsed.scheme}://{parsed.netloc}")
-            continue
-        # If no scheme provided, try assuming https
-        if '://' not in origin:
-            attempt = urlparse('https://' + origin.rstrip('/'))
-            if attempt.scheme and attempt.netloc:
-                normalized.append(f"{attempt.scheme}://{attempt.netloc}")
-                continue
-        # As a last resort, strip any trailing slash
-        cleaned = origin.rstrip('/')
-        normalized.append(cleaned)
-    return normalized
+    # Tuples can't be mutated at runtime and are accepted by django-cors-headers
+    return tuple(_normalize_origin(origin) for origin in raw_origins or () if origin)
 
 _raw_cors = config(
     'CORS_ALLOWED_ORIGINS',
@@ -156,9 +170,18 @@ SECURE_CONTENT_TYPE_NOSNIFF = True
 SECURE_BROWSER_XSS_FILTER = True
 X_FRAME_OPTIONS = 'DENY'
 
+# Password hashing: Argon2 is preferred; existing PBKDF2 hashes still verify
+# and are upgraded to Argon2 on the user's next successful login
+PASSWORD_HASHERS = [
+    'django.contrib.auth.hashers.Argon2PasswordHasher',
+    'django.contrib.auth.hashers.PBKDF2PasswordHasher',
+    'django.contrib.auth.hashers.PBKDF2SHA1PasswordHasher',
+    'django.contrib.auth.hashers.ScryptPasswordHasher',
+]
+
 # REST Framework & JWT
 REST_FRAMEWORK = {
-    'DEFAULT_RENDERER_CLASSES': ('rest_framework.renderers.JSONRenderer',),
+    'DEFAULT_RENDERER_CLASSES': ('tickr.renderers.ORJSONRenderer',),
     'DEFAULT_AUTHENTICATION_CLASSES': (
         'rest_framework_simplejwt.authentication.JWTAuthentication',
     ),
@@ -169,6 +192,8 @@ SIMPLE_JWT = {
     'ACCESS_TOKEN_LIFETIME': timedelta(days=7),
     'REFRESH_TOKEN_LIFETIME': timedelta(days=7),
     'AUTH_HEADER_TYPES': ('Bearer',),
+    'ALGORITHM': 'HS256',
+    'JSON_ENCODER': 'tickr.encoders.ORJSONEncoder',
 }
 
 # Static & Media
@@ -195,7 +220,6 @@ else:
         "default": {"BACKEND": "django.core.files.storage.FileSystemStorage"},
         "staticfiles": {"BACKEND": "django.contrib.staticfiles.storage.StaticFilesStorage"},
     }
-    IS_VERCEL = config('VERCEL', default=False, cast=bool)
     default_media_root = Path('/tmp/tickr-media') if IS_VERCEL else BASE_DIR / 'media'
     MEDIA_ROOT = Path(config('MEDIA_ROOT', default=str(default_media_root)))
     MEDIA_ROOT.mkdir(parents=True, exist_ok=True)
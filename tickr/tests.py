@@ -0,0 +1,135 @@
+import uuid
+from datetime import timedelta
+from decimal import Decimal
+
+import jwt
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.http import HttpResponse
+from django.test import RequestFactory, SimpleTestCase, override_settings
+from django.utils import timezone
+from rest_framework.renderers import JSONRenderer
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory
+
+from tickr.encoders import ORJSONEncoder
+from tickr.middleware import EnsureCORSHeadersMiddleware
+from tickr.parsers import LargeChunkMultiPartParser
+from tickr.renderers import ORJSONRenderer
+
+
+@override_settings(
+    CORS_ALLOW_ALL_ORIGINS=False,
+    CORS_ALLOWED_ORIGINS=["https://app.example.com"],
+    CORS_ALLOW_CREDENTIALS=True,
+    CORS_PREFLIGHT_MAX_AGE=600,
+    CORS_ALLOW_METHODS_HEADER="GET, POST",
+    CORS_ALLOW_HEADERS_HEADER="authorization, content-type",
+)
+class EnsureCORSHeadersMiddlewareTests(SimpleTestCase):
+    def setUp(self):
+        self.factory = RequestFactory()
+
+    def _run(self, request):
+        middleware = EnsureCORSHeadersMiddleware(lambda req: HttpResponse())
+        return middleware(request)
+
+    def test_request_without_origin_is_untouched(self):
+        response = self._run(self.factory.get("/api/user/"))
+
+        self.assertFalse(response.has_header("Access-Control-Allow-Origin"))
+
+    def test_allowed_origin_is_reflected(self):
+        response = self._run(self.factory.get("/api/user/", HTTP_ORIGIN="https://app.example.com"))
+
+        self.assertEqual(response["Access-Control-Allow-Origin"], "https://app.example.com")
+        self.assertEqual(response["Access-Control-Allow-Credentials"], "true")
+
+    def test_disallowed_origin_is_not_reflected(self):
+        response = self._run(self.factory.get("/api/user/", HTTP_ORIGIN="https://evil.example.com"))
+
+        self.assertFalse(response.has_header("Access-Control-Allow-Origin"))
+
+    def test_preflight_sets_max_age_for_allowed_origin(self):
+        response = self._run(self.factory.options("/api/user/", HTTP_ORIGIN="https://app.example.com"))
+
+        self.assertEqual(response["Access-Control-Max-Age"], "600")
+        self.assertEqual(response["Access-Control-Allow-Methods"], "GET, POST")
+        self.assertEqual(response["Access-Control-Allow-Headers"], "authorization, content-type")
+
+    def test_preflight_omits_max_age_for_disallowed_origin(self):
+        response = self._run(self.factory.options("/api/user/", HTTP_ORIGIN="https://evil.example.com"))
+
+        self.assertFalse(response.has_header("Access-Control-Max-Age"))
+
+    def test_invalid_configured_origins_are_ignored(self):
+        with self.settings(CORS_ALLOWED_ORIGINS=["ftp://files.example.com", "https://app.example.com/path"]):
+            response = self._run(self.factory.get("/api/user/", HTTP_ORIGIN="ftp://files.example.com"))
+
+        self.assertFalse(response.has_header("Access-Control-Allow-Origin"))
+
+    def test_reflected_origin_varies_on_origin(self):
+        response = self._run(self.factory.get("/api/user/", HTTP_ORIGIN="https://app.example.com"))
+
+        self.assertEqual(response["Vary"], "Origin")
+
+    def test_preflight_varies_on_request_method_and_headers(self):
+        response = self._run(self.factory.options("/api/user/", HTTP_ORIGIN="https://app.example.com"))
+
+        self.assertEqual(
+            response["Vary"],
+            "Origin, Access-Control-Request-Method, Access-Control-Request-Headers",
+        )
+
+    def test_settings_changes_are_picked_up(self):
+        middleware = EnsureCORSHeadersMiddleware(lambda req: HttpResponse())
+
+        with self.settings(CORS_ALLOW_ALL_ORIGINS=True):
+            response = middleware(self.factory.get("/api/user/", HTTP_ORIGIN="https://evil.example.com"))
+
+        self.assertEqual(response["Access-Control-Allow-Origin"], "*")
+
+
+class ORJSONEncoderTests(SimpleTestCase):
+    def test_jwt_matches_stdlib_encoding(self):
+        payload = {"user_id": 1, "token_type": "access", "jti": "abc", "exp": 1700000000}
+
+        self.assertEqual(
+            jwt.encode(payload, "secret", algorithm="HS256", json_encoder=ORJSONEncoder),
+            jwt.encode(payload, "secret", algorithm="HS256"),
+        )
+
+
+class ORJSONRendererTests(SimpleTestCase):
+    def test_output_matches_drf_json_renderer(self):
+        data = {
+            "id": 1,
+            "token": uuid.uuid4(),
+            "expires_at": timezone.now(),
+            "duration": timedelta(minutes=5),
+            "rate": Decimal("1.5"),
+            "name": "caf\u00e9 \u2028",
+            "items": [None, True, 2.5],
+        }
+
+        self.assertEqual(ORJSONRenderer().render(data), JSONRenderer().render(data))
+
+    def test_indent_falls_back_to_stock_renderer(self):
+        data = {"a": [1, 2]}
+
+        self.assertEqual(
+            ORJSONRenderer().render(data, "application/json; indent=2"),
+            JSONRenderer().render(data, "application/json; indent=2"),
+        )
+
+
+class LargeChunkMultiPartParserTests(SimpleTestCase):
+    def test_parses_files_with_raised_chunk_size(self):
+        content = b"x" * (200 * 1024)
+        upload = SimpleUploadedFile("shot.png", content, content_type="image/png")
+        django_request = APIRequestFactory().post("/api/screenshots/", {"image": upload, "note": "hi"}, format="multipart")
+        request = Request(django_request, parsers=[LargeChunkMultiPartParser()])
+
+        self.assertEqual(request.data["note"], "hi")
+        self.assertEqual(request.FILES["image"].read(), content)
+        for handler in django_request.upload_handlers:
+            self.assertEqual(handler.chunk_size, LargeChunkMultiPartParser.chunk_size)
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.7 on 2026-10-15 03:06
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('user', '0003_user_created_at'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='user',
+            name='username',
+            field=models.CharField(blank=True, db_index=True, max_length=255, null=True),
+        ),
+    ]
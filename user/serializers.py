@@ -1,4 +1,6 @@
 # serializers.py
+import copy
+
 from rest_framework import serializers
 from .models import User
 from rest_framework.exceptions import AuthenticationFailed
@@ -8,11 +10,10 @@ class UserSerializer(serializers.ModelSerializer):
     password = serializers.CharField(
         write_only=True, required=True, style={"input_type": "password"}
     )
-    is_admin = serializers.SerializerMethodField()
-    role = serializers.SerializerMethodField()
 
     class Meta:
         model = User
+        # "is_admin" and "role" are derived in to_representation
         fields = [
             "id",
             "email",
@@ -20,8 +21,6 @@ class UserSerializer(serializers.ModelSerializer):
             "password",
             "is_staff",
             "is_superuser",
-            "is_admin",
-            "role",
         ]
         extra_kwargs = {
             "password": {"write_only": True},
@@ -29,13 +28,12 @@ class UserSerializer(serializers.ModelSerializer):
             "is_superuser": {"read_only": True},
         }
 
-    def get_is_admin(self, obj):
-        return bool(
-            getattr(obj, "is_staff", False) or getattr(obj, "is_superuser", False)
-        )
-
-    def get_role(self, obj):
-        return "admin" if self.get_is_admin(obj) else "employee"
+    def to_representation(self, instance):
+        data = super().to_representation(instance)
+        is_admin = instance.is_admin
+        data["is_admin"] = is_admin
+        data["role"] = "admin" if is_admin else "employee"
+        return data
 
     def create(self, validated_data):
         password = validated_data.pop("password")
@@ -46,14 +44,45 @@ class UserSerializer(serializers.ModelSerializer):
 
     def update(self, instance, validated_data):
         password = validated_data.pop("password", None)
+        update_fields = list(validated_data)
         for attr, value in validated_data.items():
             setattr(instance, attr, value)
         if password:
             instance.set_password(password)
-        instance.save()
+            update_fields.append("password")
+        # Only write the submitted columns (PATCH usually touches one or two)
+        if update_fields:
+            instance.save(update_fields=update_fields)
         return instance
 
 
+def user_to_dict(user):
+    """Build the UserSerializer read payload without ModelSerializer overhead"""
+    is_admin = user.is_admin
+    return {
+        "id": user.id,
+        "email": user.email,
+        "username": user.username,
+        "is_staff": user.is_staff,
+        "is_superuser": user.is_superuser,
+        "is_admin": is_admin,
+        "role": "admin" if is_admin else "employee",
+    }
+
+
+# Columns the login flow reads (auth, token claims, response payload);
+# avatar and timestamps are left deferred
+LOGIN_USER_FIELDS = (
+    "id",
+    "password",
+    "is_active",
+    "email",
+    "username",
+    "is_staff",
+    "is_superuser",
+)
+
+
 class LoginSerializer(serializers.Serializer):
     email = serializers.CharField(required=False)
     username = serializers.CharField(required=False)
@@ -67,13 +96,14 @@ class LoginSerializer(serializers.Serializer):
         if not email and not username:
             raise AuthenticationFailed("Email or username is required")
 
+        users = User.objects.only(*LOGIN_USER_FIELDS)
         try:
             # Try login by email
             if email:
-                user = User.objects.get(email=email)
+                user = users.get(email=email)
             # Or login by username
             else:
-                user = User.objects.get(username=username)
+                user = users.get(username=username)
 
         except User.DoesNotExist:
             raise AuthenticationFailed("User not found")
@@ -82,6 +112,9 @@ class LoginSerializer(serializers.Serializer):
         if not user.check_password(password):
             raise AuthenticationFailed("Invalid credentials")
 
+        if not user.is_active:
+            raise AuthenticationFailed("User account is disabled")
+
         # Return user object so the view can access it
         return {
             "user": user,
@@ -113,6 +146,16 @@ class SignupSerializer(serializers.ModelSerializer):
             "confirmPassword",
         ]
 
+    def get_fields(self):
+        # The field set depends only on Meta, so run ModelSerializer's model
+        # introspection once per class and give each instance fresh copies
+        # (the same deepcopy plain Serializers do with _declared_fields)
+        fields = type(self).__dict__.get("_prototype_fields")
+        if fields is None:
+            fields = super().get_fields()
+            type(self)._prototype_fields = fields
+        return copy.deepcopy(fields)
+
     def validate(self, data):
         password = data.get("password")
         password2 = (
@@ -1,11 +1,13 @@
+from django.contrib.auth.hashers import make_password
 from django.urls import reverse
 from django.test import override_settings
 from rest_framework import status
 from rest_framework.exceptions import AuthenticationFailed
 from rest_framework.test import APITestCase
+from rest_framework_simplejwt.settings import api_settings as jwt_settings
 
 from user.models import User
-from user.serializers import LoginSerializer, SignupSerializer
+from user.serializers import LoginSerializer, SignupSerializer, UserSerializer, user_to_dict
 
 
 class LoginSerializerTests(APITestCase):
@@ -26,6 +28,23 @@ class LoginSerializerTests(APITestCase):
 		with self.assertRaises(AuthenticationFailed):
 			serializer.is_valid(raise_exception=True)
 
+	def test_login_serializer_rejects_inactive_user(self):
+		User.objects.create_user(email="inactive@example.com", password="secret", is_active=False)
+		serializer = LoginSerializer(data={"email": "inactive@example.com", "password": "secret"})
+		with self.assertRaises(AuthenticationFailed):
+			serializer.is_valid(raise_exception=True)
+
+	def test_login_upgrades_legacy_pbkdf2_hash(self):
+		user = User.objects.create_user(email="legacy@example.com", password="unused")
+		user.password = make_password("legacy-pass", hasher="pbkdf2_sha256")
+		user.save(update_fields=["password"])
+
+		serializer = LoginSerializer(data={"email": "legacy@example.com", "password": "legacy-pass"})
+		self.assertTrue(serializer.is_valid(), serializer.errors)
+
+		user.refresh_from_db()
+		self.assertTrue(user.password.startswith("argon2"))
+
 
 class LoginEndpointTests(APITestCase):
 	def test_login_member_redirects_to_timer(self):
@@ -35,11 +54,30 @@ class LoginEndpointTests(APITestCase):
 		resp = self.client.post(url, {"email": "m@x.com", "password": "pass"}, format="json")
 
 		self.assertEqual(resp.status_code, status.HTTP_200_OK)
-		self.assertEqual(resp.data.get("role"), "employee")
-		self.assertEqual(resp.data.get("redirect_url"), "/employee")
-		self.assertIn("access", resp.data)
-		self.assertIn("refresh", resp.data)
-		self.assertIn("user", resp.data)
+		data = resp.json()
+		self.assertEqual(data.get("role"), "employee")
+		self.assertEqual(data.get("redirect_url"), "/employee")
+		self.assertIn("access", data)
+		self.assertIn("refresh", data)
+		self.assertIn("user", data)
+
+	def test_login_cookies_match_response_tokens(self):
+		User.objects.create_user(email="c@x.com", password="pass", username="c")
+
+		resp = self.client.post(reverse("login"), {"email": "c@x.com", "password": "pass"}, format="json")
+
+		self.assertEqual(resp.status_code, status.HTTP_200_OK)
+		data = resp.json()
+		self.assertEqual(resp.cookies["access"].value, data["access"])
+		self.assertEqual(resp.cookies["refresh"].value, data["refresh"])
+
+	def test_login_cookies_last_as_long_as_tokens(self):
+		User.objects.create_user(email="p@x.com", password="pass", username="p")
+
+		resp = self.client.post(reverse("login"), {"email": "p@x.com", "password": "pass"}, format="json")
+
+		self.assertEqual(resp.cookies["access"]["max-age"], int(jwt_settings.ACCESS_TOKEN_LIFETIME.total_seconds()))
+		self.assertEqual(resp.cookies["refresh"]["max-age"], int(jwt_settings.REFRESH_TOKEN_LIFETIME.total_seconds()))
 
 	def test_login_admin_redirects_to_admin(self):
 		User.objects.create_superuser(email="admin@admin.com", password="admin")
@@ -48,9 +86,10 @@ class LoginEndpointTests(APITestCase):
 		resp = self.client.post(url, {"email": "admin@admin.com", "password": "admin"}, format="json")
 
 		self.assertEqual(resp.status_code, status.HTTP_200_OK)
-		self.assertEqual(resp.data.get("role"), "admin")
-		self.assertEqual(resp.data.get("redirect_url"), "/admin")
-		self.assertTrue(resp.data.get("is_admin"))
+		data = resp.json()
+		self.assertEqual(data.get("role"), "admin")
+		self.assertEqual(data.get("redirect_url"), "/admin")
+		self.assertTrue(data.get("is_admin"))
 
 	def test_login_user_not_found(self):
 		url = reverse("login")
@@ -83,6 +122,20 @@ class SignupSerializerTests(APITestCase):
 		)
 		self.assertTrue(serializer.is_valid(), serializer.errors)
 
+	def test_signup_serializer_instances_get_their_own_fields(self):
+		first = SignupSerializer()
+		second = SignupSerializer()
+		self.assertIsNot(first.fields["email"], second.fields["email"])
+		self.assertIs(second.fields["email"].parent, second)
+
+	def test_signup_serializer_rejects_duplicate_email(self):
+		User.objects.create_user(email="dup@example.com", password="secret123")
+		serializer = SignupSerializer(
+			data={"email": "dup@example.com", "password": "secret123", "password2": "secret123"}
+		)
+		self.assertFalse(serializer.is_valid())
+		self.assertIn("email", serializer.errors)
+
 
 @override_settings(SECURE_SSL_REDIRECT=False)
 class SignupEndpointTests(APITestCase):
@@ -118,3 +171,26 @@ class CurrentUserProfileTests(APITestCase):
 		response = self.client.get(reverse("current_user"))
 		self.assertEqual(response.status_code, status.HTTP_200_OK)
 		self.assertNotIn("avatar", response.data)
+
+	def test_current_user_response_includes_admin_flags(self):
+		response = self.client.get(reverse("current_user"))
+		self.assertEqual(response.status_code, status.HTTP_200_OK)
+		self.assertFalse(response.data["is_admin"])
+		self.assertEqual(response.data["role"], "employee")
+
+	def test_current_user_response_is_not_cacheable(self):
+		response = self.client.get(reverse("current_user"))
+		self.assertIn("no-store", response["Cache-Control"])
+		self.assertIn("private", response["Cache-Control"])
+
+	def test_patch_updates_only_submitted_fields(self):
+		response = self.client.patch(reverse("current_user"), {"username": "renamed"}, format="json")
+		self.assertEqual(response.status_code, status.HTTP_200_OK)
+		self.assertEqual(response.data["username"], "renamed")
+
+		self.user.refresh_from_db()
+		self.assertEqual(self.user.username, "renamed")
+		self.assertTrue(self.user.check_password("secret123"))
+
+	def test_user_to_dict_matches_user_serializer(self):
+		self.assertEqual(user_to_dict(self.user), dict(UserSerializer(self.user).data))
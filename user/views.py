@@ -2,20 +2,35 @@ from rest_framework import status
 from rest_framework.permissions import AllowAny, IsAuthenticated
 from rest_framework.response import Response
 from rest_framework.views import APIView
-from rest_framework.parsers import MultiPartParser, FormParser, JSONParser
+from rest_framework.parsers import FormParser, JSONParser
+from rest_framework_simplejwt.settings import api_settings as jwt_settings
 from rest_framework_simplejwt.tokens import RefreshToken
 from django.conf import settings
 from django.db import DatabaseError, IntegrityError
+from django.http import JsonResponse
+from django.views.decorators.cache import never_cache
 from django.views.decorators.csrf import csrf_exempt
 from django.utils.decorators import method_decorator
 import logging
-from .serializers import UserSerializer, LoginSerializer, SignupSerializer
+from .serializers import UserSerializer, LoginSerializer, SignupSerializer, user_to_dict
 from admin_site.admin_config import get_admin_setting
 from admin_site.utils import log_user_access_event
+from tickr.encoders import ORJSONEncoder
+from tickr.parsers import LargeChunkMultiPartParser
 
 logger = logging.getLogger(__name__)
 
+# Auth cookies are cross-site (SameSite=None) in production, which requires Secure
+_SECURE_COOKIE = not settings.DEBUG
+_COOKIE_KW = {
+    "httponly": True,
+    "secure": _SECURE_COOKIE,
+    "samesite": "None" if _SECURE_COOKIE else "Lax",
+    "path": "/",
+}
+
 @method_decorator(csrf_exempt, name='dispatch')
+@method_decorator(never_cache, name='dispatch')
 class LoginView(APIView):
     permission_classes = [AllowAny]
     authentication_classes = []
@@ -34,50 +49,41 @@ class LoginView(APIView):
         user = serializer.validated_data["user"]
 
         refresh = RefreshToken.for_user(user)
-        access = refresh.access_token
+        # str() signs the token, so encode each one once and reuse the result
+        refresh_str = str(refresh)
+        access_str = str(refresh.access_token)
 
-        is_staff = bool(getattr(user, "is_staff", False))
-        is_superuser = bool(getattr(user, "is_superuser", False))
-        is_admin = is_staff or is_superuser
+        is_admin = user.is_admin
         role = "admin" if is_admin else "employee"
         
         payload = {
             "message": "Login successful",
-            "access": str(access),
-            "refresh": str(refresh),
-            "user": UserSerializer(user).data,
-            "is_staff": is_staff,
-            "is_superuser": is_superuser,
+            "access": access_str,
+            "refresh": refresh_str,
+            "user": user_to_dict(user),
+            "is_staff": user.is_staff,
+            "is_superuser": user.is_superuser,
             "is_admin": is_admin,
             "role": role,
             "redirect_url": "/admin" if is_admin else "/employee",
         }
 
-        response = Response(payload, status=status.HTTP_200_OK)
+        # Hot endpoint with a fixed, plain payload: skip DRF content negotiation
+        # and rendering. ORJSONEncoder keeps the body compact like other responses.
+        response = JsonResponse(payload, encoder=ORJSONEncoder)
 
         log_user_access_event(user, "login", request=request)
 
-        try:
-            secure_cookie = not settings.DEBUG
-            same_site = "None" if secure_cookie else "Lax"
-            response.set_cookie(
-                key="access",
-                value=str(access),
-                httponly=True,
-                secure=secure_cookie,
-                samesite=same_site,
-                path="/",
-            )
-            response.set_cookie(
-                key="refresh",
-                value=str(refresh),
-                httponly=True,
-                secure=secure_cookie,
-                samesite=same_site,
-                path="/",
-            )
-        except Exception:
-            pass
+        # Persist the cookies for as long as the tokens are valid, so a new
+        # browser session doesn't force another (password-hashing) login
+        response.set_cookie(
+            "access", access_str,
+            max_age=int(jwt_settings.ACCESS_TOKEN_LIFETIME.total_seconds()), **_COOKIE_KW
+        )
+        response.set_cookie(
+            "refresh", refresh_str,
+            max_age=int(jwt_settings.REFRESH_TOKEN_LIFETIME.total_seconds()), **_COOKIE_KW
+        )
 
         return response
 
@@ -93,6 +99,7 @@ class LogoutView(APIView):
         response.delete_cookie("refresh", path="/")
         return response
     
+@method_decorator(never_cache, name='dispatch')
 class SignupView(APIView):
     permission_classes = [AllowAny]
     serializer_class = SignupSerializer
@@ -124,14 +131,15 @@ class SignupView(APIView):
             )
 
 
+@method_decorator(never_cache, name='dispatch')
 class CurrentUserView(APIView):
     """Get or update the current authenticated user."""
-    parser_classes = [JSONParser, MultiPartParser, FormParser]
+    parser_classes = [JSONParser, LargeChunkMultiPartParser, FormParser]
     permission_classes = [IsAuthenticated]
 
     def get(self, request):
-        serializer = UserSerializer(request.user, context={"request": request})
-        return Response(serializer.data, status=status.HTTP_200_OK)
+        # Hot, read-only path: skip UserSerializer field binding
+        return Response(user_to_dict(request.user), status=status.HTTP_200_OK)
 
     def patch(self, request):
         serializer = UserSerializer(request.user, data=request.data, partial=True, context={"request": request})
@@ -144,5 +152,6 @@ class CurrentUserView(APIView):
                     {"detail": "Avatar upload is temporarily unavailable. Please try again later."},
                     status=status.HTTP_503_SERVICE_UNAVAILABLE,
                 )
-            return Response(serializer.data, status=status.HTTP_200_OK)
+            # Same payload as serializer.data, without another to_representation pass
+            return Response(user_to_dict(serializer.instance), status=status.HTTP_200_OK)
         return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)